@@ -1,20 +1,34 @@
-from flask import Flask, jsonify
+import orjson
+from flask import Flask, Response
+
+HEALTH_BODY = orjson.dumps({'ok': True})
+NO_PRICE_CACHE_MAX = 1024  # symbols come from the URL, so bound the sentinel cache
 
 class Services:
+    __slots__ = ('price_feed',)
+
     def __init__(self, price_feed=None):
         self.price_feed = price_feed
 
 
 def create_app(services: Services):
     app = Flask(__name__)
+    # {"symbol": S, "price": null} bodies, built on first miss per symbol
+    no_price = {}
 
     @app.get('/health')
     def health():
-        return jsonify({'ok': True})
+        return Response(HEALTH_BODY, mimetype='application/json')
 
     @app.get('/prices/<symbol>')
     def price(symbol):
-        price = services.price_feed.get_price(symbol) if services.price_feed else None
-        return jsonify({'symbol': symbol, 'price': price})
+        body = services.price_feed.get_price_json(symbol) if services.price_feed else None
+        if body is None:
+            body = no_price.get(symbol)
+            if body is None:
+                body = orjson.dumps({'symbol': symbol, 'price': None})
+                if len(no_price) < NO_PRICE_CACHE_MAX:
+                    no_price[symbol] = body
+        return Response(body, mimetype='application/json')
 
-    return app
\ No newline at end of file
+    return app
@@ -1,16 +1,98 @@
-from typing import List, Dict
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+import numpy as np
 from binance import Client
 
+# (API base URL, symbol, interval, limit) -> raw klines; shared by all fetchers in the process
+_cache: Dict[Tuple[str, str, str, int], list] = {}
+
+
+def _api_base(client) -> str:
+    """REST base URL the client's get_klines hits; python-binance keeps API_URL and switches on .testnet."""
+    if getattr(client, 'testnet', False):
+        return getattr(client, 'API_TESTNET_URL', '') or 'testnet'
+    return getattr(client, 'API_URL', '') or ''
+
+
+def _fresh(raw: list) -> bool:
+    """True until the last kline closes, i.e. while no newer candle can exist.
+
+    Uses Binance's own close time, so weekly (Monday-open) and calendar-month candles are handled.
+    """
+    return bool(raw) and time.time() * 1000 <= raw[-1][6]
+
+
+@dataclass(frozen=True, slots=True)
+class Bars:
+    """Kline columns as NumPy arrays (one allocation per column instead of a dict per bar)."""
+    open_time: np.ndarray
+    close_time: np.ndarray
+    o: np.ndarray
+    h: np.ndarray
+    l: np.ndarray
+    c: np.ndarray
+    v: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.c)
+
+    def iter_dicts(self) -> Iterator[Dict]:
+        """Per-bar dicts in the old klines() shape, for code that still consumes them."""
+        cols = (self.open_time, self.o, self.h, self.l, self.c, self.v, self.close_time)
+        for ot, o, h, l, c, v, ct in zip(*(col.tolist() for col in cols)):
+            yield {'open_time': ot, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v, 'close_time': ct}
+
+
 class DataFetcher:
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, cache_dir: Optional[str] = None):
         self.client = client
+        # optional on-disk copy of the cache, for reuse across processes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
-    def klines(self, symbol: str, interval: str = Client.KLINE_INTERVAL_1MINUTE, limit: int = 500) -> List[Dict]:
+    def _raw(self, symbol: str, interval: str, limit: int) -> list:
+        """Raw klines, refetched only once the last cached kline has closed."""
+        # testnet and mainnet (or any other base URL) return different data for the same symbol
+        base = _api_base(self.client)
+        key = (base, symbol, interval, limit)
+        raw = _cache.get(key)
+        if raw is not None and _fresh(raw):
+            return raw
+        path = None
+        if self.cache_dir:
+            path = self.cache_dir / (urlparse(base).netloc or 'default') / f"{symbol}_{interval}_{limit}.pkl"
+        if path is not None and path.exists():
+            try:
+                raw = pickle.loads(path.read_bytes())
+                if _fresh(raw):
+                    _cache[key] = raw
+                    return raw
+            except Exception:
+                pass
         raw = self.client.get_klines(symbol=symbol, interval=interval, limit=limit)
-        out = []
-        for k in raw:
-            out.append({
-                'open_time': k[0], 'open': float(k[1]), 'high': float(k[2]), 'low': float(k[3]), 'close': float(k[4]),
-                'volume': float(k[5]), 'close_time': k[6]
-            })
-        return out
\ No newline at end of file
+        _cache[key] = raw
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(pickle.dumps(raw, protocol=pickle.HIGHEST_PROTOCOL))
+        return raw
+
+    def klines(self, symbol: str, interval: str = Client.KLINE_INTERVAL_1MINUTE, limit: int = 500) -> Bars:
+        raw = self._raw(symbol, interval, limit)
+        if not raw:
+            f8, i8 = np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+            return Bars(i8, i8, f8, f8, f8, f8, f8)
+        n = len(raw)
+        # typed conversion straight from the rows, without an intermediate object array
+        open_time = np.fromiter((k[0] for k in raw), dtype=np.int64, count=n)
+        close_time = np.fromiter((k[6] for k in raw), dtype=np.int64, count=n)
+        # one (5, n) float64 block; each OHLCV column is a contiguous row view of it
+        o, h, l, c, v = np.array([k[1:6] for k in raw], dtype=np.float64).T.copy()
+        return Bars(open_time, close_time, o, h, l, c, v)
+
+    def ohlcv(self, symbol: str, interval: str = Client.KLINE_INTERVAL_1MINUTE, limit: int = 500) -> Tuple[np.ndarray, ...]:
+        """Return (open, high, low, close, volume) as separate float64 arrays."""
+        bars = self.klines(symbol, interval, limit)
+        return bars.o, bars.h, bars.l, bars.c, bars.v
@@ -1,12 +1,49 @@
-from typing import List, Dict
+from typing import Dict, Iterable, List, Union
+import numpy as np
+
+from app.backtest.data import Bars
+
+from app.strategy.sma_crossover import JIT_MIN_BARS, SMACrossover, crossover_state, window_sums
+from . import kernels
+
+
+def _window_sum_table(closes: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """Row r holds the windows[r]-bar window sums aligned to closes, NaN until the window fills."""
+    n = len(closes)
+    table = np.full((len(windows), n), np.nan)
+    for r, w in enumerate(windows.tolist()):
+        if w <= n:
+            table[r, w - 1:] = window_sums(closes, w)
+    return table
+
+
+def _signal_trades(closes: np.ndarray, sig: np.ndarray):
+    """(equity, trade prices, is-buy mask) for a 0/1 long signal starting flat."""
+    # position starts flat, so a LONG on the first bar is an entry too
+    idx = np.flatnonzero(np.diff(sig, prepend=np.int8(0)))
+    prices = closes[idx]
+    buys = sig[idx].astype(bool)
+    # entries and exits alternate; an open position is marked to the last close
+    equity = float(prices[~buys].sum() - prices[buys].sum())
+    if len(closes) and sig[-1]:
+        equity += float(closes[-1])
+    return equity, prices, buys
+
 
 class Backtester:
     def __init__(self, strategy):
         self.strategy = strategy
 
-    def run(self, symbol: str, bars: List[Dict]):
+    def run(self, symbol: str, bars: Union[Bars, Iterable[Dict]]):
+        if isinstance(bars, Bars):
+            # typed columns go straight to the array path when the strategy has one
+            try:
+                return self.run_vectorized(symbol, bars.c)
+            except NotImplementedError:
+                bars = bars.iter_dicts()
         equity = 0.0
         position = 0.0
+        entry = 0.0
         last_price = None
         trades = []
         for bar in bars:
@@ -17,9 +54,62 @@ class Backtester:
             if sig['signal'] == 'LONG' and position <= 0:
                 # enter long 1 unit for simplicity
                 position = 1.0
+                entry = last_price
                 trades.append({'action': 'BUY', 'price': last_price})
             elif sig['signal'] == 'FLAT' and position > 0:
                 # exit to flat
                 position = 0.0
+                equity += last_price - entry
                 trades.append({'action': 'SELL', 'price': last_price})
-        return {'equity': equity, 'trades': trades}
\ No newline at end of file
+        if position > 0:
+            # mark the open position to the last close
+            equity += last_price - entry
+        return {'equity': equity, 'trades': trades}
+
+    def run_vectorized(self, symbol: str, closes: np.ndarray):
+        """Same semantics as run(), driven by the strategy's signals() array instead of per-bar calls."""
+        closes = np.ascontiguousarray(closes, dtype=np.float64)
+        if kernels.HAVE_NUMBA and isinstance(self.strategy, SMACrossover) and len(closes) > JIT_MIN_BARS:
+            pnl, t = kernels.sma_cross_pnl(closes, self.strategy.fast, self.strategy.slow)
+            trades = [
+                {'action': 'BUY' if side > 0 else 'SELL', 'price': price}
+                for side, price in zip(t[:, 1].tolist(), t[:, 2].tolist())
+            ]
+            return {'equity': pnl, 'trades': trades}
+        equity, prices, buys = _signal_trades(closes, self.strategy.signals(closes))
+        trades = [
+            {'action': 'BUY' if b else 'SELL', 'price': price}
+            for b, price in zip(buys.tolist(), prices.tolist())
+        ]
+        return {'equity': equity, 'trades': trades}
+
+    @staticmethod
+    def sweep(closes: np.ndarray, fast_windows: Iterable[int], slow_windows: Iterable[int]) -> List[Dict]:
+        """Backtest SMA crossover over every fast < slow window pair, best equity first."""
+        closes = np.ascontiguousarray(closes, dtype=np.float64)
+        pairs = [(f, s) for f in fast_windows for s in slow_windows if f < s]
+        if not pairs:
+            return []
+        fw = np.array([p[0] for p in pairs], dtype=np.int64)
+        sw = np.array([p[1] for p in pairs], dtype=np.int64)
+        if kernels.HAVE_NUMBA:
+            pnl, counts = kernels.sma_sweep(closes, fw, sw)
+        else:
+            # each distinct window is summed once, then every pair compares two rows
+            windows = np.unique(np.concatenate((fw, sw)))
+            table = _window_sum_table(closes, windows)
+            row = {w: r for r, w in enumerate(windows.tolist())}
+            pnl = np.empty(len(pairs))
+            counts = np.empty(len(pairs), dtype=np.int64)
+            for j, (f, s) in enumerate(pairs):
+                sig = np.zeros(len(closes), dtype=np.int8)
+                if s <= len(closes):
+                    sig[s - 1:] = crossover_state(table[row[f], s - 1:], table[row[s], s - 1:], f, s)
+                equity, prices, _ = _signal_trades(closes, sig)
+                pnl[j] = equity
+                counts[j] = len(prices)
+        order = np.argsort(-pnl, kind='stable')
+        return [
+            {'fast': int(fw[j]), 'slow': int(sw[j]), 'equity': float(pnl[j]), 'trades': int(counts[j])}
+            for j in order.tolist()
+        ]
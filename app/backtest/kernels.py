@@ -0,0 +1,58 @@
+"""Backtest PnL passes over the SMA crossover signals from app.strategy._kernels (numba only; check HAVE_NUMBA)."""
+import numpy as np
+
+from app.strategy._kernels import HAVE_NUMBA
+
+if HAVE_NUMBA:
+    from numba import njit, prange
+    from app.strategy._kernels import sma_crossover_signals
+
+    @njit(cache=True)
+    def signal_pnl(closes, sig):
+        """Long-only 1-unit PnL of a 0/1 signal that starts flat.
+
+        Returns (pnl, trades) where trades is an (k, 3) array of [bar index, side, price]
+        with side +1 for BUY and -1 for SELL; pnl marks an open position to the last close.
+        """
+        n = closes.shape[0]
+        trades = np.empty((n, 3))
+        k = 0
+        pos = 0
+        entry = 0.0
+        pnl = 0.0
+        for i in range(n):
+            s = sig[i]
+            if s == pos:
+                continue
+            x = closes[i]
+            if s == 1:
+                entry = x
+                trades[k, 1] = 1.0
+            else:
+                pnl += x - entry
+                trades[k, 1] = -1.0
+            trades[k, 0] = i
+            trades[k, 2] = x
+            k += 1
+            pos = s
+        if pos == 1:
+            pnl += closes[n - 1] - entry
+        return pnl, trades[:k]
+
+    # no cache=True on the two below: numba's on-disk cache is keyed on this file only, so a
+    # cached copy would keep an old sma_crossover_signals after app/strategy/_kernels.py changes
+    @njit
+    def sma_cross_pnl(closes, fw, sw):
+        return signal_pnl(closes, sma_crossover_signals(closes, fw, sw))
+
+    @njit(parallel=True)
+    def sma_sweep(closes, fast_windows, slow_windows):
+        """Backtest every (fast_windows[j], slow_windows[j]) pair; pairs run in parallel."""
+        m = fast_windows.shape[0]
+        pnl = np.empty(m)
+        counts = np.empty(m, dtype=np.int64)
+        for j in prange(m):
+            p, t = sma_cross_pnl(closes, fast_windows[j], slow_windows[j])
+            pnl[j] = p
+            counts[j] = t.shape[0]
+        return pnl, counts
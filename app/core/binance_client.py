@@ -1,26 +1,51 @@
+import hashlib
+import hmac
 import logging
 from typing import Optional
 from binance import Client
 
+FUTURES_TESTNET_URL = 'https://testnet.binancefuture.com'
+
+# Resolved once against the installed python-binance: the futures base-URL attribute
+# has been renamed across versions, so only the names this Client defines are kept.
+_FUTURES_URL_ATTRS = tuple(
+    attr for attr in ('FUTURES_URL', 'futures_url', 'futures_api_url', 'UM_FUTURES_URL', 'UMFUTURES_URL')
+    if hasattr(Client, attr)
+)
+
 class BinanceClientFactory:
     """Creates a configured python-binance Client with robust futures testnet URLs."""
 
     @staticmethod
     def create(api_key: str, api_secret: str, testnet: bool = True, logger: Optional[logging.Logger] = None) -> Client:
         client = Client(api_key, api_secret, testnet=testnet)
+        if api_secret:
+            BinanceClientFactory.cache_hmac_key(client, api_secret)
         if testnet:
             BinanceClientFactory._force_testnet_futures_urls(client, logger)
         return client
 
+    @staticmethod
+    def cache_hmac_key(client: Client, api_secret: str):
+        """Sign with a copy of a pre-keyed HMAC instead of re-deriving the key pads per request."""
+        base = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+
+        def _hmac_signature(query_string: str) -> str:
+            m = base.copy()
+            m.update(query_string.encode('utf-8'))
+            return m.hexdigest()
+
+        client._hmac_signature = _hmac_signature
+
     @staticmethod
     def _force_testnet_futures_urls(client: Client, logger: Optional[logging.Logger]):
-        base = 'https://testnet.binancefuture.com'
-        for attr in (
-            'FUTURES_URL', 'futures_url', 'futures_api_url', 'UM_FUTURES_URL', 'UMFUTURES_URL'
-        ):
-            if hasattr(client, attr):
-                try:
-                    setattr(client, attr, base)
-                except Exception as e:
-                    if logger:
-                        logger.debug(f"Ignoring error setting {attr}: {e}")
\ No newline at end of file
+        if not _FUTURES_URL_ATTRS:
+            if logger:
+                logger.warning("python-binance Client exposes no known futures URL attribute; testnet URL not applied")
+            return
+        for attr in _FUTURES_URL_ATTRS:
+            try:
+                setattr(client, attr, FUTURES_TESTNET_URL)
+            except Exception as e:
+                if logger:
+                    logger.debug("Ignoring error setting %s: %s", attr, e)
@@ -0,0 +1,23 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def mount_pooled_adapter(session: requests.Session, pool_connections: int = 4, pool_maxsize: int = 32,
+                         retries: int = 2, backoff_factor: float = 0.1) -> requests.Session:
+    """Mount a keep-alive connection pool with retries on an existing session.
+
+    The python-binance Client owns a preconfigured session (API key header, user agent),
+    so the adapter is mounted in place rather than swapping the session out. urllib3's
+    default Retry only repeats idempotent methods, so order POSTs are never resent.
+    A session that already has a pooled adapter is left as configured.
+    """
+    if getattr(session, '_pooled_adapter', False):
+        return session
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=backoff_factor),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session._pooled_adapter = True
+    return session
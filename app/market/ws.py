@@ -1,33 +1,96 @@
-from binance import ThreadedWebsocketManager
-from threading import Lock
+import asyncio
+import threading
+import aiohttp
+import orjson
+
+STREAM_URL = 'wss://stream.binance.com:9443/stream?streams='
+STREAM_TESTNET_URL = 'wss://testnet.binance.vision/stream?streams='
+
+RECONNECT_SEC = 5
 
 class PriceFeed:
     def __init__(self, api_key: str, api_secret: str, testnet: bool, logger):
+        # ticker streams are public; credentials are accepted for interface compatibility
         self.logger = logger
-        self.twm = ThreadedWebsocketManager(api_key=api_key, api_secret=api_secret, testnet=testnet)
+        self.testnet = testnet
+        self._loop = None
+        self._thread = None
+        self._consumer = None
+        # written only by the feed's event loop; single-key dict reads are atomic under the GIL
         self.latest = {}
-        self._lock = Lock()
+        # pre-serialized /prices payloads, rebuilt on each tick so readers skip encoding
+        self.latest_json = {}
 
     def start(self, symbols):
-        self.twm.start()
-        for s in symbols:
-            self.twm.start_symbol_ticker_socket(callback=self._on_ticker, symbol=s)
+        # one background thread runs one asyncio loop; the loop owns the combined-stream
+        # socket for every symbol and is the only writer of latest/latest_json
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._spawn(symbols), self._loop).result()
+
+    async def _spawn(self, symbols):
+        self._consumer = asyncio.create_task(self._consume(symbols))
 
-    def _on_ticker(self, msg):
+    async def _consume(self, symbols):
+        base = STREAM_TESTNET_URL if self.testnet else STREAM_URL
+        url = base + '/'.join(f"{s.lower()}@miniTicker" for s in symbols)
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    async with session.ws_connect(url, heartbeat=30) as ws:
+                        async for msg in ws:
+                            if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                                self._apply(msg.data)
+                            elif msg.type == aiohttp.WSMsgType.ERROR:
+                                break
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.logger.error(f"WS error: {e}")
+                await asyncio.sleep(RECONNECT_SEC)
+
+    def _apply(self, frame):
         try:
-            symbol = msg['s']
-            price = float(msg['c'])
-            with self._lock:
-                self.latest[symbol] = price
+            data = orjson.loads(frame)['data']
         except Exception as e:
             self.logger.error(f"WS parse error: {e}")
+            return
+        # '<symbol>@miniTicker' streams carry one ticker; '!miniTicker@arr' carries a list
+        if not isinstance(data, list):
+            data = (data,)
+        latest = self.latest
+        latest_json = self.latest_json
+        dumps = orjson.dumps
+        for t in data:
+            try:
+                symbol = t['s']
+                price = float(t['c'])
+            except Exception as e:
+                self.logger.error(f"WS parse error: {e}")
+                continue
+            latest[symbol] = price
+            latest_json[symbol] = dumps({'symbol': symbol, 'price': price})
 
     def get_price(self, symbol):
-        with self._lock:
-            return self.latest.get(symbol)
+        return self.latest.get(symbol)
+
+    def get_price_json(self, symbol):
+        return self.latest_json.get(symbol)
+
+    async def _shutdown(self):
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+        asyncio.get_running_loop().stop()
 
     def stop(self):
         try:
-            self.twm.stop()
+            if self._loop is not None and self._loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+                self._thread.join(timeout=5)
         except Exception:
-            pass
\ No newline at end of file
+            pass
@@ -1,30 +1,91 @@
-from typing import Dict, Any, List
+import json
+from decimal import Decimal
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from app.storage.db import save_orders_many
+
+BATCH_LIMIT = 5  # max orders per /fapi/v1/batchOrders call
 
 class GridTrader:
     """Simple grid: place layered limit buy/sell orders around a reference price."""
 
-    def __init__(self, client, logger):
+    def __init__(self, client, logger, futures: bool = False):
         self.client = client
         self.logger = logger
+        # Futures supports batchOrders; Spot has no batch endpoint and places one order per level.
+        self.futures = futures
 
-    def build_grid(self, symbol: str, base_price: float, levels: int, step_pct: float, qty: str, side: str) -> Dict[str, Any]:
+    def build_grid(self, symbol: str, base_price: float, levels: int, step_pct: float, qty: str, side: str,
+                   tick_size: Optional[str] = None) -> Dict[str, Any]:
+        orders: List[Dict] = []
+        side = side.upper()
         try:
-            orders: List[Dict] = []
-            for i in range(1, levels + 1):
-                if side.upper() == 'BUY':
-                    price = base_price * (1 - step_pct * i)
+            prices = self._grid_prices(symbol, base_price, levels, step_pct, side, tick_size)
+            if self.futures:
+                self._place_batched(symbol, side, qty, prices, orders)
+            else:
+                for price in prices:
                     order = self.client.create_order(
-                        symbol=symbol, side='BUY', type='LIMIT', timeInForce='GTC',
-                        quantity=qty, price=str(price)
+                        symbol=symbol, side=side, type='LIMIT', timeInForce='GTC',
+                        quantity=qty, price=price
                     )
-                else:
-                    price = base_price * (1 + step_pct * i)
-                    order = self.client.create_order(
-                        symbol=symbol, side='SELL', type='LIMIT', timeInForce='GTC',
-                        quantity=qty, price=str(price)
-                    )
-                orders.append(order)
+                    orders.append(order)
             return {'success': True, 'orders': orders}
         except Exception as e:
             self.logger.error(f"Grid build failed: {e}")
-            return {'success': False, 'error': str(e)}
\ No newline at end of file
+            return {'success': False, 'error': str(e), 'orders': orders}
+        finally:
+            self._persist(orders)
+
+    def _grid_prices(self, symbol: str, base_price: float, levels: int, step_pct: float, side: str,
+                     tick_size: Optional[str]) -> List[str]:
+        """Level prices rounded to the symbol's tick size, formatted at its fixed precision."""
+        sign = -1.0 if side == 'BUY' else 1.0
+        i = np.arange(1, levels + 1, dtype=np.float64)
+        prices = base_price * (1.0 + sign * step_pct * i)
+        tick = tick_size or self._tick_size(symbol)
+        if not tick:
+            return [str(p) for p in prices.tolist()]
+        tick_d = Decimal(str(tick)).normalize()
+        precision = max(-tick_d.as_tuple().exponent, 0)
+        t = float(tick_d)
+        prices = np.round(prices / t) * t
+        return [f"{p:.{precision}f}" for p in prices.tolist()]
+
+    def _tick_size(self, symbol: str) -> Optional[str]:
+        try:
+            if self.futures:
+                info = next((s for s in self.client.futures_exchange_info()['symbols'] if s['symbol'] == symbol), None)
+            else:
+                info = self.client.get_symbol_info(symbol)
+            if info:
+                for f in info['filters']:
+                    if f.get('filterType') == 'PRICE_FILTER':
+                        return f['tickSize']
+        except Exception as e:
+            self.logger.warning(f"Tick size lookup failed for {symbol}, prices left unrounded: {e}")
+        return None
+
+    def _place_batched(self, symbol: str, side: str, qty: str, prices: List[str], orders: List[Dict]):
+        for start in range(0, len(prices), BATCH_LIMIT):
+            chunk = [
+                {'symbol': symbol, 'side': side, 'type': 'LIMIT', 'timeInForce': 'GTC',
+                 'quantity': qty, 'price': price}
+                for price in prices[start:start + BATCH_LIMIT]
+            ]
+            resp = self.client.futures_place_batch_order(batchOrders=json.dumps(chunk))
+            # each entry is either the order or a {'code', 'msg'} rejection
+            failed = [r for r in resp if 'code' in r and 'orderId' not in r]
+            orders.extend(r for r in resp if 'orderId' in r)
+            if failed:
+                raise RuntimeError(f"Batch rejected {len(failed)}/{len(chunk)} orders: {failed[0].get('msg')}")
+
+    def _persist(self, orders: List[Dict]):
+        if not orders:
+            return
+        try:
+            save_orders_many(orders)
+        except Exception:
+            self.logger.warning("Failed to persist grid orders to DB")
@@ -1,4 +1,7 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from app.core.async_rest import AsyncOrderClient
+from app.core.http import mount_pooled_adapter
 
 class OCOManager:
     """OCO manager: prefers native Binance OCO; falls back to client-side TP/SL pair."""
@@ -6,35 +9,68 @@ class OCOManager:
     def __init__(self, client, logger):
         self.client = client
         self.logger = logger
+        # resolved once; the client's capabilities don't change after construction
+        self._has_native = callable(getattr(client, 'create_oco_order', None))
+        session = getattr(client, 'session', None)
+        if session is not None:
+            mount_pooled_adapter(session)
 
     def submit(self, symbol: str, side: str, qty: str, tp_price: str, sl_price: str) -> Dict[str, Any]:
         exit_side = 'SELL' if side.upper() == 'BUY' else 'BUY'
         # Try native OCO first (Spot)
-        try:
-            if hasattr(self.client, 'create_oco_order'):
-                oco = self.client.create_oco_order(
-                    symbol=symbol,
-                    side=exit_side,
-                    quantity=qty,
-                    price=tp_price,              # TP limit price
-                    stopPrice=sl_price,          # SL trigger
-                    stopLimitPrice=sl_price,     # SL limit
-                    stopLimitTimeInForce='GTC'
-                )
+        if self._has_native:
+            try:
+                oco = self.client.create_oco_order(**self._oco_params(symbol, exit_side, qty, tp_price, sl_price))
                 return {'success': True, 'oco': oco, 'mode': 'native'}
+            except Exception as ne:
+                self.logger.warning(f"Native OCO failed, falling back to client-side: {ne}")
+        # Fallback: place TP and SL as two separate orders
+        try:
+            tp = self.client.create_order(**self._tp_params(symbol, exit_side, qty, tp_price))
+            sl = self.client.create_order(**self._sl_params(symbol, exit_side, qty, sl_price))
+            return {'success': True, 'tp': tp, 'sl': sl, 'mode': 'client'}
+        except Exception as e:
+            self.logger.error(f"OCO submit failed: {e}")
+            return {'success': False, 'error': str(e)}
+
+    async def submit_async(self, symbol: str, side: str, qty: str, tp_price: str, sl_price: str,
+                           rest: Optional[AsyncOrderClient] = None) -> Dict[str, Any]:
+        """Event-loop variant of submit() over the shared aiohttp session."""
+        if rest is None:
+            async with AsyncOrderClient(self.client) as rest:
+                return await self.submit_async(symbol, side, qty, tp_price, sl_price, rest)
+        exit_side = 'SELL' if side.upper() == 'BUY' else 'BUY'
+        try:
+            oco = await rest.create_oco_order(**self._oco_params(symbol, exit_side, qty, tp_price, sl_price))
+            return {'success': True, 'oco': oco, 'mode': 'native'}
         except Exception as ne:
             self.logger.warning(f"Native OCO failed, falling back to client-side: {ne}")
-        # Fallback: place TP and SL as two separate orders
         try:
-            tp = self.client.create_order(
-                symbol=symbol, side=exit_side, type='LIMIT', timeInForce='GTC',
-                quantity=qty, price=tp_price
-            )
-            sl = self.client.create_order(
-                symbol=symbol, side=exit_side, type='STOP_LOSS_LIMIT', timeInForce='GTC',
-                quantity=qty, price=sl_price, stopPrice=sl_price
-            )
+            tp = await rest.create_order(**self._tp_params(symbol, exit_side, qty, tp_price))
+            sl = await rest.create_order(**self._sl_params(symbol, exit_side, qty, sl_price))
             return {'success': True, 'tp': tp, 'sl': sl, 'mode': 'client'}
         except Exception as e:
             self.logger.error(f"OCO submit failed: {e}")
-            return {'success': False, 'error': str(e)}
\ No newline at end of file
+            return {'success': False, 'error': str(e)}
+
+    @staticmethod
+    def _oco_params(symbol, exit_side, qty, tp_price, sl_price) -> Dict[str, Any]:
+        return dict(
+            symbol=symbol,
+            side=exit_side,
+            quantity=qty,
+            price=tp_price,              # TP limit price
+            stopPrice=sl_price,          # SL trigger
+            stopLimitPrice=sl_price,     # SL limit
+            stopLimitTimeInForce='GTC'
+        )
+
+    @staticmethod
+    def _tp_params(symbol, exit_side, qty, tp_price) -> Dict[str, Any]:
+        return dict(symbol=symbol, side=exit_side, type='LIMIT', timeInForce='GTC',
+                    quantity=qty, price=tp_price)
+
+    @staticmethod
+    def _sl_params(symbol, exit_side, qty, sl_price) -> Dict[str, Any]:
+        return dict(symbol=symbol, side=exit_side, type='STOP_LOSS_LIMIT', timeInForce='GTC',
+                    quantity=qty, price=sl_price, stopPrice=sl_price)
@@ -1,28 +1,157 @@
+import asyncio
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
+from app.core.async_rest import AsyncOrderClient
+from app.storage.db import save_orders_many
+
+_SPIN_SEC = 0.0001  # busy-wait the last 100us for sub-millisecond slice placement
+MAX_ORDERS_PER_SEC = 10  # Binance per-second order limit
+
+
+def _sleep_until(deadline: float, cancel: Optional[threading.Event] = None) -> bool:
+    """Block until deadline; returns False if cancel is set, even when the deadline has already passed."""
+    if cancel is not None and cancel.is_set():
+        return False
+    delay = deadline - time.perf_counter() - _SPIN_SEC
+    if delay > 0:
+        if cancel is None:
+            time.sleep(delay)
+        elif cancel.wait(delay):
+            return False
+    while time.perf_counter() < deadline:
+        pass
+    return True
+
+
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart, across threads and coroutines alike."""
+
+    def __init__(self, rate: float):
+        self._gap = 1.0 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            slot = max(time.perf_counter(), self._next)
+            self._next = slot + self._gap
+        return slot
+
+    def wait(self, cancel: Optional[threading.Event] = None) -> bool:
+        return _sleep_until(self._reserve(), cancel)
+
+    async def wait_async(self):
+        delay = self._reserve() - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class TWAPExecutor:
     """Execute a target quantity over a duration, splitting into slices at fixed interval."""
 
     def __init__(self, client, logger):
         self.client = client
         self.logger = logger
+        # shared by the blocking and asyncio paths, so concurrent TWAPs stay under the limit together
+        self._limiter = _RateLimiter(MAX_ORDERS_PER_SEC)
 
-    def execute(self, symbol: str, side: str, total_qty: float, duration_sec: int, slices: int, min_slice_qty: float = 0.0) -> Dict[str, Any]:
+    def execute(self, symbol: str, side: str, total_qty: float, duration_sec: int, slices: int, min_slice_qty: float = 0.0,
+                max_workers: int = 4) -> Dict[str, Any]:
+        """Blocking TWAP: slices are sent from a small thread pool; callers on an event loop use execute_async."""
         if slices <= 0 or duration_sec <= 0:
             return {'success': False, 'error': 'Invalid slices/duration'}
         interval = duration_sec / slices
-        slice_qty = max(total_qty / slices, min_slice_qty)
-        placed = []
-        for i in range(slices):
+        params = {'symbol': symbol, 'side': side.upper(), 'type': 'MARKET',
+                  'quantity': str(max(total_qty / slices, min_slice_qty))}
+        limiter = self._limiter
+        failed = threading.Event()
+        errors = []
+
+        def place(i: int, deadline: float):
+            # a worker holds slice i until its slot, so a slow response only delays its own slice
+            if not _sleep_until(deadline, failed) or not limiter.wait(failed) or failed.is_set():
+                return None
             try:
-                order = self.client.create_order(
-                    symbol=symbol, side=side.upper(), type='MARKET', quantity=str(slice_qty)
-                )
-                placed.append(order)
-                self.logger.info(f"TWAP slice {i+1}/{slices} placed: {order.get('orderId')}")
+                order = self.client.create_order(**params)
             except Exception as e:
                 self.logger.error(f"TWAP slice {i+1} failed: {e}")
-                return {'success': False, 'placed': placed, 'error': str(e)}
-            time.sleep(interval)
-        return {'success': True, 'placed': placed}
\ No newline at end of file
+                errors.append(e)
+                # slices still waiting for their slot are dropped; requests already sent complete
+                failed.set()
+                return None
+            self.logger.info(f"TWAP slice {i+1}/{slices} placed: {order.get('orderId')}")
+            return order
+
+        # slice i fires at t0 + i*interval, so REST latency doesn't push later slices back
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(place, i, t0 + i * interval) for i in range(slices)]
+        placed = [order for order in (f.result() for f in futures) if order]
+        self._persist(placed)
+        if errors:
+            return {'success': False, 'placed': placed, 'error': str(errors[0])}
+        return {'success': True, 'placed': placed}
+
+    async def execute_async(self, symbol: str, side: str, total_qty: float, duration_sec: int, slices: int,
+                            min_slice_qty: float = 0.0, max_in_flight: int = 4,
+                            rest: Optional[AsyncOrderClient] = None) -> Dict[str, Any]:
+        """Opt-in asyncio variant for callers already on an event loop (HMAC clients only, see AsyncOrderClient).
+
+        Slice i is sent at t0 + i*interval even if earlier responses are still pending.
+        """
+        if slices <= 0 or duration_sec <= 0:
+            return {'success': False, 'error': 'Invalid slices/duration'}
+        if rest is None:
+            async with AsyncOrderClient(self.client) as rest:
+                return await self.execute_async(symbol, side, total_qty, duration_sec, slices,
+                                                min_slice_qty, max_in_flight, rest)
+        interval = duration_sec / slices
+        params = {'symbol': symbol, 'side': side.upper(), 'type': 'MARKET',
+                  'quantity': str(max(total_qty / slices, min_slice_qty))}
+        loop = asyncio.get_running_loop()
+        in_flight = asyncio.Semaphore(max_in_flight)
+        errors = []
+        waiting = set()
+
+        async def place(i: int, t0: float):
+            delay = t0 + i * interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            waiting.discard(asyncio.current_task())
+            async with in_flight:
+                # in_flight caps concurrency; the limiter caps the send rate
+                await self._limiter.wait_async()
+                if errors:
+                    return None
+                try:
+                    order = await rest.create_order(**params)
+                except Exception as e:
+                    self.logger.error(f"TWAP slice {i+1} failed: {e}")
+                    errors.append(e)
+                    # stop slices not yet sent, as the blocking path does; in-flight ones complete
+                    for t in waiting:
+                        t.cancel()
+                    return None
+            self.logger.info(f"TWAP slice {i+1}/{slices} placed: {order.get('orderId')}")
+            return order
+
+        t0 = loop.time()
+        tasks = [asyncio.create_task(place(i, t0)) for i in range(slices)]
+        waiting.update(tasks)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        placed = [r for r in results if isinstance(r, dict)]
+        self._persist(placed)
+        if errors:
+            return {'success': False, 'placed': placed, 'error': str(errors[0])}
+        return {'success': True, 'placed': placed}
+
+    def _persist(self, orders):
+        if not orders:
+            return
+        try:
+            save_orders_many(orders)
+        except Exception:
+            self.logger.warning("Failed to persist TWAP orders to DB")
@@ -1,11 +1,35 @@
 class RiskManager:
+    __slots__ = ('_max_risk_usdt', '_stop_loss_pct', '_k')
+
     def __init__(self, max_risk_usdt=50.0, stop_loss_pct=0.01):
-        self.max_risk_usdt = max_risk_usdt
-        self.stop_loss_pct = stop_loss_pct
+        self._max_risk_usdt = max_risk_usdt
+        self._stop_loss_pct = stop_loss_pct
+        self._refold()
+
+    def _refold(self):
+        # risk / stop_loss_pct folded once so sizing is a single division per call
+        self._k = self._max_risk_usdt / self._stop_loss_pct
+
+    @property
+    def max_risk_usdt(self):
+        return self._max_risk_usdt
+
+    @max_risk_usdt.setter
+    def max_risk_usdt(self, value):
+        self._max_risk_usdt = value
+        self._refold()
+
+    @property
+    def stop_loss_pct(self):
+        return self._stop_loss_pct
+
+    @stop_loss_pct.setter
+    def stop_loss_pct(self, value):
+        self._stop_loss_pct = value
+        self._refold()
 
     def size_position(self, price: float) -> float:
         # Qty = risk / (price * stop_loss_pct)
         if price <= 0:
             return 0.0
-        qty = self.max_risk_usdt / (price * self.stop_loss_pct)
-        return max(qty, 0.001)
\ No newline at end of file
+        return max(self._k / price, 0.001)
@@ -1,4 +1,7 @@
+import atexit
 import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Iterable
 
@@ -26,37 +29,98 @@ SCHEMA = [
     );'''
 ]
 
+PRAGMAS = [
+    'PRAGMA journal_mode=WAL;',
+    'PRAGMA synchronous=NORMAL;',
+    'PRAGMA temp_store=MEMORY;',
+]
+
+INSERT_ORDER = """
+    INSERT INTO orders (binance_order_id, symbol, side, type, price, qty, status, ts)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# save_order buffers rows and writes them in one transaction once either limit is hit
+FLUSH_ROWS = 256
+FLUSH_SEC = 1.0
+
+# One connection shared by every writer; sqlite3 objects are not safe for
+# concurrent use, so all access (including the row buffer) goes through _lock.
+_conn = None
+_lock = threading.Lock()
+_buf = []
+_last_flush = time.monotonic()
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    return _conn
+
+
+def _order_row(order: dict) -> tuple:
+    return (
+        str(order.get('orderId')),
+        order.get('symbol'),
+        order.get('side'),
+        order.get('type'),
+        float(order.get('price') or order.get('stopPrice') or 0),
+        float(order.get('origQty') or order.get('executedQty') or 0),
+        order.get('status'),
+        int(order.get('transactTime') or order.get('time') or 0),
+    )
+
+
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    try:
-        cur = conn.cursor()
+    with _lock:
+        conn = _get_conn()
+        for stmt in PRAGMAS:
+            conn.execute(stmt)
         for stmt in SCHEMA:
-            cur.execute(stmt)
-        conn.commit()
-    finally:
-        conn.close()
+            conn.execute(stmt)
 
 
-def save_order(order: dict):
-    conn = sqlite3.connect(DB_PATH)
+def _insert_rows(rows):
+    conn = _get_conn()
+    conn.execute('BEGIN')
     try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO orders (binance_order_id, symbol, side, type, price, qty, status, ts)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(order.get('orderId')),
-                order.get('symbol'),
-                order.get('side'),
-                order.get('type'),
-                float(order.get('price') or order.get('stopPrice') or 0),
-                float(order.get('origQty') or order.get('executedQty') or 0),
-                order.get('status'),
-                int(order.get('transactTime') or order.get('time') or 0),
-            ),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+        conn.executemany(INSERT_ORDER, rows)
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
+
+
+def _take_buffer() -> list:
+    global _buf, _last_flush
+    buf, _buf = _buf, []
+    _last_flush = time.monotonic()
+    return buf
+
+
+def save_order(order: dict):
+    """Queue one order; rows reach the DB every FLUSH_ROWS orders or FLUSH_SEC seconds, and at exit."""
+    row = _order_row(order)
+    with _lock:
+        _buf.append(row)
+        if len(_buf) >= FLUSH_ROWS or time.monotonic() - _last_flush > FLUSH_SEC:
+            _insert_rows(_take_buffer())
+
+
+def flush():
+    """Write any buffered save_order rows now."""
+    with _lock:
+        buf = _take_buffer()
+        if buf:
+            _insert_rows(buf)
+
+
+def save_orders_many(orders: Iterable[dict]):
+    """Insert a batch of orders (plus anything buffered) in a single transaction."""
+    rows = [_order_row(o) for o in orders]
+    with _lock:
+        _insert_rows(_take_buffer() + rows)
+
+
+atexit.register(flush)
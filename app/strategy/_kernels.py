@@ -0,0 +1,52 @@
+"""Numba-compiled SMA crossover kernels. numba is optional; check HAVE_NUMBA before calling."""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# fast*slow-scaled window sums within this relative distance count as a tie (state kept).
+# Every SMA path uses it, so rounding differences between running sums, cumsums and
+# summation order can't flip a tie; it is far below one price tick on real series.
+TIE_RTOL = 1e-12
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def sma_crossover_signals(closes, fast, slow):
+        """int8 signal per bar (1 = LONG, 0 = FLAT; ties keep the state), from O(1) running sums."""
+        n = closes.shape[0]
+        sig = np.zeros(n, dtype=np.int8)
+        warm = max(fast, slow)
+        fs = 0.0
+        ss = 0.0
+        state = 0
+        for i in range(n):
+            x = closes[i]
+            fs += x
+            ss += x
+            if i >= fast:
+                fs -= closes[i - fast]
+            if i >= slow:
+                ss -= closes[i - slow]
+            if i >= warm - 1:
+                f = fs * slow
+                s = ss * fast
+                tol = TIE_RTOL * (abs(f) + abs(s))
+                if f - s > tol:
+                    state = 1
+                elif f - s < -tol:
+                    state = 0
+                sig[i] = state
+        return sig
+
+    @njit(cache=True, parallel=True)
+    def sma_crossover_signals_batch(paths, fast, slow):
+        """Signals for many close series at once (e.g. Monte-Carlo paths), rows in parallel."""
+        m, n = paths.shape
+        out = np.zeros((m, n), dtype=np.int8)
+        for r in prange(m):
+            out[r] = sma_crossover_signals(paths[r], fast, slow)
+        return out
@@ -1,4 +1,10 @@
 class Strategy:
+    __slots__ = ()
+
     def on_bar_close(self, symbol: str, ohlc):
         """Return a signal dict or None. ohlc: {'open','high','low','close','volume'}"""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def signals(self, closes):
+        """Return an int8 array aligned with closes: 1 = LONG, 0 = FLAT. Optional vectorized path."""
+        raise NotImplementedError
@@ -1,7 +1,36 @@
 from collections import deque
+import numpy as np
 from .base import Strategy
+from . import _kernels
+from ._kernels import TIE_RTOL
+
+# below this the cumsum path wins over JIT dispatch overhead
+JIT_MIN_BARS = 5000
+
+
+def window_sums(closes: np.ndarray, w: int) -> np.ndarray:
+    """Sum of each w-bar window, for the bars w-1..n-1, from one cumsum."""
+    # centering on the first close keeps the cumsum small, so differencing it loses little precision
+    c0 = closes[0]
+    cs = np.concatenate(([0.0], np.cumsum(closes - c0)))
+    return cs[w:] - cs[:-w] + w * c0
+
+
+def crossover_state(fast_sums: np.ndarray, slow_sums: np.ndarray, fast: int, slow: int) -> np.ndarray:
+    """1 = LONG, 0 = FLAT from aligned window sums, compared like on_bar_close; a tie keeps the previous state."""
+    f = fast_sums * slow
+    s = slow_sums * fast
+    d = f - s
+    tol = TIE_RTOL * (np.abs(f) + np.abs(s))
+    cross = (d > tol).astype(np.int8) - (d < -tol)
+    last = np.where(cross != 0, np.arange(len(cross)), 0)
+    np.maximum.accumulate(last, out=last)
+    return (cross[last] > 0).astype(np.int8)
+
 
 class SMACrossover(Strategy):
+    __slots__ = ('fast', 'slow', 'buf')
+
     def __init__(self, fast=20, slow=50):
         self.fast = fast
         self.slow = slow
@@ -9,14 +38,41 @@ class SMACrossover(Strategy):
 
     def on_bar_close(self, symbol, ohlc):
         close = float(ohlc['close'])
-        d = self.buf.setdefault(symbol, {'fast': deque(maxlen=self.fast), 'slow': deque(maxlen=self.slow)})
-        d['fast'].append(close)
-        d['slow'].append(close)
-        if len(d['fast']) == self.fast and len(d['slow']) == self.slow:
-            f = sum(d['fast'])/self.fast
-            s = sum(d['slow'])/self.slow
-            if f > s:
+        d = self.buf.get(symbol)
+        if d is None:
+            d = self.buf[symbol] = {'fast': deque(maxlen=self.fast), 'slow': deque(maxlen=self.slow), 'fs': 0.0, 'ss': 0.0}
+        # keep running sums so each bar costs O(1) instead of re-summing both windows
+        fq, sq = d['fast'], d['slow']
+        if len(fq) == self.fast:
+            d['fs'] -= fq[0]
+        if len(sq) == self.slow:
+            d['ss'] -= sq[0]
+        fq.append(close)
+        sq.append(close)
+        d['fs'] += close
+        d['ss'] += close
+        if len(fq) == self.fast and len(sq) == self.slow:
+            # fs/fast vs ss/slow, cross-multiplied to avoid the divisions
+            f = d['fs'] * self.slow
+            s = d['ss'] * self.fast
+            tol = TIE_RTOL * (abs(f) + abs(s))
+            if f - s > tol:
                 return {'symbol': symbol, 'signal': 'LONG'}
-            if f < s:
+            if f - s < -tol:
                 return {'symbol': symbol, 'signal': 'FLAT'}
-        return None
\ No newline at end of file
+        return None
+
+    def signals(self, closes):
+        closes = np.ascontiguousarray(closes, dtype=np.float64)
+        if _kernels.HAVE_NUMBA and len(closes) > JIT_MIN_BARS:
+            return _kernels.sma_crossover_signals(closes, self.fast, self.slow)
+        sig = np.zeros(len(closes), dtype=np.int8)
+        warm = max(self.fast, self.slow)
+        if len(closes) < warm:
+            return sig
+        n = len(closes) - warm + 1
+        # both window-sum series end on the same bar; keep the last n values of each
+        fast_sums = window_sums(closes, self.fast)[-n:]
+        slow_sums = window_sums(closes, self.slow)[-n:]
+        sig[warm - 1:] = crossover_state(fast_sums, slow_sums, self.fast, self.slow)
+        return sig
@@ -0,0 +1 @@
+# Root-level conftest so pytest puts the repo root on sys.path and tests can import app.
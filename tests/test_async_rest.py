@@ -0,0 +1,77 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from app.core.async_rest import AsyncOrderClient
+
+
+class StubClient:
+    """The python-binance Client attributes AsyncOrderClient borrows."""
+
+    API_KEY = 'KEY'
+    API_SECRET = 'SECRET'
+    PRIVATE_KEY = None
+    REQUEST_TIMEOUT = 10
+    timestamp_offset = 0
+
+    def __init__(self, base: str, timeout: float = 10):
+        self.base = base
+        self.REQUEST_TIMEOUT = timeout
+
+    def _create_api_uri(self, path: str, signed: bool = True) -> str:
+        return f"{self.base}/api/v3/{path}"
+
+
+async def _place_order(session_factory, delay: float = 0, timeout: float = 10, elapsed=None):
+    seen = []
+
+    async def order(request):
+        body = await request.post()
+        await asyncio.sleep(delay)
+        seen.append((request.headers.get('X-MBX-APIKEY'), 'signature' in body))
+        return web.json_response({'orderId': 1, 'symbol': body['symbol']})
+
+    app = web.Application()
+    app.router.add_post('/api/v3/order', order)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        client = StubClient(f"http://127.0.0.1:{port}", timeout)
+        session = session_factory()
+        start = asyncio.get_running_loop().time()
+        try:
+            async with AsyncOrderClient(client, session=session) as rest:
+                order = await rest.create_order(symbol='BTCUSDT', side='BUY', type='MARKET', quantity='1')
+        finally:
+            if elapsed is not None:
+                elapsed.append(asyncio.get_running_loop().time() - start)
+            if session is not None:
+                await session.close()
+    finally:
+        await runner.cleanup()
+    return order, seen
+
+
+def test_owned_session_sends_api_key():
+    order, seen = asyncio.run(_place_order(lambda: None))
+    assert order['orderId'] == 1
+    assert seen == [('KEY', True)]
+
+
+def test_caller_session_sends_api_key():
+    order, seen = asyncio.run(_place_order(aiohttp.ClientSession))
+    assert order['orderId'] == 1
+    assert seen == [('KEY', True)]
+
+
+@pytest.mark.parametrize('session_factory', [lambda: None, aiohttp.ClientSession])
+def test_stalled_order_times_out_at_request_timeout(session_factory):
+    elapsed = []
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(_place_order(session_factory, delay=1.5, timeout=0.2, elapsed=elapsed))
+    assert elapsed[0] < 1
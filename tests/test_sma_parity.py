@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from app.backtest import kernels
+from app.backtest.engine import Backtester
+from app.strategy import _kernels
+from app.strategy.sma_crossover import JIT_MIN_BARS, SMACrossover
+
+WINDOWS = [(20, 50), (5, 20), (3, 7)]
+
+
+def _flat(n):
+    return np.full(n, 64123.45)
+
+
+def _integer_walk(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return 1000.0 + np.cumsum(rng.integers(-1, 2, size=n)).astype(np.float64)
+
+
+def _tick_walk(n, seed=1):
+    # quiet market: moves of -1/0/+1 ticks of 0.01, so window means tie often
+    rng = np.random.default_rng(seed)
+    return np.round(64123.45 + 0.01 * np.cumsum(rng.integers(-1, 2, size=n)), 2)
+
+
+SERIES = {'flat': _flat, 'integer': _integer_walk, 'tick': _tick_walk}
+
+
+def _per_bar(closes, fast, slow):
+    return Backtester(SMACrossover(fast, slow)).run('X', [{'close': c} for c in closes.tolist()])
+
+
+def _trades(res):
+    return [(t['action'], t['price']) for t in res['trades']]
+
+
+@pytest.fixture
+def numpy_only(monkeypatch):
+    monkeypatch.setattr(_kernels, 'HAVE_NUMBA', False)
+    monkeypatch.setattr(kernels, 'HAVE_NUMBA', False)
+
+
+@pytest.mark.parametrize('name', SERIES)
+@pytest.mark.parametrize('fast,slow', WINDOWS)
+def test_numpy_path_matches_per_bar(numpy_only, name, fast, slow):
+    closes = SERIES[name](500)
+    expected = _per_bar(closes, fast, slow)
+    got = Backtester(SMACrossover(fast, slow)).run_vectorized('X', closes)
+    assert _trades(got) == _trades(expected)
+    assert got['equity'] == pytest.approx(expected['equity'], abs=1e-6)
+
+
+def test_flat_series_never_trades(numpy_only):
+    closes = _flat(500)
+    assert _per_bar(closes, 20, 50)['trades'] == []
+    assert Backtester(SMACrossover(20, 50)).run_vectorized('X', closes)['trades'] == []
+
+
+@pytest.mark.skipif(not kernels.HAVE_NUMBA, reason='numba not installed')
+@pytest.mark.parametrize('name', SERIES)
+@pytest.mark.parametrize('fast,slow', WINDOWS)
+def test_jit_path_matches_per_bar(name, fast, slow):
+    closes = SERIES[name](JIT_MIN_BARS + 1000)
+    expected = _per_bar(closes, fast, slow)
+    strategy = SMACrossover(fast, slow)
+    got = Backtester(strategy).run_vectorized('X', closes)
+    assert _trades(got) == _trades(expected)
+    assert got['equity'] == pytest.approx(expected['equity'], abs=1e-6)
+    assert np.array_equal(strategy.signals(closes), _kernels.sma_crossover_signals(closes, fast, slow))
+
+
+@pytest.mark.skipif(not kernels.HAVE_NUMBA, reason='numba not installed')
+@pytest.mark.parametrize('name', SERIES)
+def test_sweep_fallback_matches_kernel(monkeypatch, name):
+    closes = SERIES[name](1500)
+    fast, slow = range(5, 51, 5), range(20, 201, 10)
+    jit = {(r['fast'], r['slow']): r for r in Backtester.sweep(closes, fast, slow)}
+    monkeypatch.setattr(kernels, 'HAVE_NUMBA', False)
+    for r in Backtester.sweep(closes, fast, slow):
+        k = jit[(r['fast'], r['slow'])]
+        assert r['trades'] == k['trades']
+        assert r['equity'] == pytest.approx(k['equity'], abs=1e-6)
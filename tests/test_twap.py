@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import threading
+import time
+
+from app.orders import twap as twap_mod
+from app.orders.twap import TWAPExecutor
+
+
+class SlowFailingClient:
+    """Blocking client whose first order fails after a delay."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def create_order(self, **params):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        time.sleep(self.latency)
+        if n == 1:
+            raise RuntimeError('rejected')
+        return {'orderId': n, **params}
+
+
+def test_failed_slice_drops_overdue_slices(monkeypatch):
+    monkeypatch.setattr(twap_mod, 'save_orders_many', lambda orders: None)
+    client = SlowFailingClient(latency=1.0)
+    res = TWAPExecutor(client, logging.getLogger('test')).execute('BTCUSDT', 'BUY', 1.0, 3, 15)
+    assert res['success'] is False
+    # slices 2-4 were already in flight next to slice 1; every slice that was still
+    # waiting (overdue or not) when it failed must not be sent
+    assert client.calls <= 4
+    assert len(res['placed']) == client.calls - 1
+
+
+class RecordingRest:
+    """Stands in for AsyncOrderClient and records when each order is sent."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def create_order(self, **params):
+        self.sent.append(time.perf_counter())
+        return {'orderId': len(self.sent), **params}
+
+
+def test_async_path_respects_order_rate(monkeypatch):
+    monkeypatch.setattr(twap_mod, 'save_orders_many', lambda orders: None)
+    rest = RecordingRest()
+    executor = TWAPExecutor(object(), logging.getLogger('test'))
+    res = asyncio.run(executor.execute_async('BTCUSDT', 'BUY', 1.0, 1, 20, rest=rest))
+    assert res['success'] is True
+    assert len(rest.sent) == 20
+    gap = 1.0 / twap_mod.MAX_ORDERS_PER_SEC
+    assert min(b - a for a, b in zip(rest.sent, rest.sent[1:])) >= gap * 0.99
+
+
+def test_hmac_client_uses_blocking_pool(monkeypatch):
+    monkeypatch.setattr(twap_mod, 'save_orders_many', lambda orders: None)
+
+    class HmacClient(SlowFailingClient):
+        API_SECRET = 'secret'
+        PRIVATE_KEY = None
+
+        def create_order(self, **params):
+            with self._lock:
+                self.calls += 1
+            return {'orderId': self.calls, **params}
+
+    client = HmacClient(latency=0)
+    res = TWAPExecutor(client, logging.getLogger('test')).execute('BTCUSDT', 'BUY', 1.0, 1, 5)
+    assert res['success'] is True
+    assert client.calls == 5
@@ -1,15 +1,19 @@
+import atexit
+import functools
 import logging
-import json
+import logging.handlers
+import queue
 import time
 import threading
 import sqlite3
 from decimal import Decimal, ROUND_DOWN
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List
 from binance import Client
 from binance.exceptions import BinanceAPIException, BinanceOrderException
 import argparse
 import sys
 import os
+import orjson
 from dotenv import load_dotenv
 
 # New modules
@@ -19,16 +23,73 @@ from app.orders.grid import GridTrader
 from app.market.ws import PriceFeed
 from app.strategy.sma_crossover import SMACrossover
 from app.risk.manager import RiskManager
-from app.storage.db import init_db, save_order
+from app.storage.db import init_db, save_orders_many
 from app.api.server import create_app, Services
 from app.backtest.data import DataFetcher
 from app.backtest.engine import Backtester
+from app.core.binance_client import BinanceClientFactory
+from app.core.http import mount_pooled_adapter
+
+# exchange_info is large and changes rarely; refetch at most this often (seconds)
+SYMBOL_INFO_TTL = 300
+
+# background order persistence: write up to this many orders per transaction,
+# waiting at most PERSIST_MAX_WAIT seconds for a batch to fill
+PERSIST_BATCH = 100
+PERSIST_MAX_WAIT = 0.05
+
+_VALID_SIDES = frozenset({'BUY', 'SELL'})
+# Spot order types accepted by place_* and the ones that need a price
+_VALID_TYPES = frozenset({'MARKET', 'LIMIT', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'})
+_PRICED_TYPES = frozenset({'LIMIT', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'})
+
+# above this many units a float no longer holds every integer exactly; use Decimal
+_MAX_EXACT_UNITS = 2 ** 53
+
+
+def _step_grid(step: str) -> Dict[str, Any]:
+    """Pre-parse a stepSize/tickSize into an integer grid: value = units / scale"""
+    step_d = Decimal(str(step)).normalize()
+    precision = max(-step_d.as_tuple().exponent, 0)
+    scale = 10 ** precision
+    return {'step': step_d, 'precision': precision, 'scale': scale, 'units': int(step_d * scale)}
+
+
+def _quantize_down(value: float, grid: Dict[str, Any]) -> str:
+    """Round value down to the grid, formatted like Decimal.normalize() (no trailing zeros)"""
+    scale = grid['scale']
+    units = value * scale
+    if not 0 <= units < _MAX_EXACT_UNITS or grid['units'] <= 0:
+        q = (Decimal(str(value)) // grid['step']) * grid['step']
+        return format(q.normalize(), 'f')
+    # the product can land one unit off (0.29 * 100 == 28.999999999999996); units / scale
+    # is the nearest float to the decimal units/10**precision, so compare in that domain
+    units = int(units)
+    if (units + 1) / scale <= value:
+        units += 1
+    elif units / scale > value:
+        units -= 1
+    units -= units % grid['units']
+    if not grid['precision']:
+        return str(units)
+    return f"{units / grid['scale']:.{grid['precision']}f}".rstrip('0').rstrip('.')
+
+
+def _dumps(obj) -> str:
+    """Compact JSON text via orjson (several times faster than json.dumps on order payloads)"""
+    return orjson.dumps(obj).decode()
+
 
 class TradingBot:
     """
     A simplified trading bot for Binance Spot Testnet
     Supports market, limit, stop-limit orders, OCO, and comprehensive logging
     """
+
+    __slots__ = (
+        'client', 'logger', '_symbols_by_name', '_exchange_info_ts', '_filter_cache',
+        '_persist_q', '_persist_thread', '_log_listener', '_create_order',
+    )
     
     def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
         """
@@ -39,6 +100,13 @@ class TradingBot:
             api_secret (str): Binance API secret
             testnet (bool): Whether to use testnet (default: True)
         """
+        # symbol -> symbol info, filled from one exchange_info call at _exchange_info_ts
+        self._symbols_by_name: Dict[str, Dict] = {}
+        self._exchange_info_ts = float('-inf')
+        # symbol -> {'lot': grid, 'price': grid} pre-parsed from LOT_SIZE / PRICE_FILTER (see _step_grid)
+        self._filter_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # symbol -> client.create_order with symbol= pre-bound (see _order_fn)
+        self._create_order: Dict[str, Callable[..., Dict]] = {}
         try:
             # Spot Testnet: use testnet host explicitly
             if testnet:
@@ -51,9 +119,20 @@ class TradingBot:
                     pass
             else:
                 self.client = Client(api_key, api_secret)
+            # keep-alive pool so bursts of orders reuse connections instead of re-handshaking
+            mount_pooled_adapter(self.client.session, pool_connections=20, pool_maxsize=20)
+            # sign every request (bot, OCO, TWAP, grid share this client) from a pre-keyed HMAC
+            BinanceClientFactory.cache_hmac_key(self.client, api_secret)
 
             # Setup logging
             self.setup_logging()
+
+            # orders are handed to a writer thread so SQLite never sits on the order path;
+            # registered after logging so its exit flush runs before the log listener stops
+            self._persist_q: queue.Queue = queue.Queue()
+            self._persist_thread = threading.Thread(target=self._persist_loop, daemon=True)
+            self._persist_thread.start()
+            atexit.register(self._stop_persist)
             
             # Test connection and fail early with helpful message
             if not self.test_connection():
@@ -72,6 +151,42 @@ class TradingBot:
                 pass
             raise
     
+    def _persist_loop(self):
+        """Writer thread: batch queued orders into one DB transaction; None stops it"""
+        while True:
+            order = self._persist_q.get()
+            if order is None:
+                return
+            batch = [order]
+            deadline = time.monotonic() + PERSIST_MAX_WAIT
+            stop = False
+            while len(batch) < PERSIST_BATCH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    order = self._persist_q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if order is None:
+                    stop = True
+                    break
+                batch.append(order)
+            self._write_orders(batch)
+            if stop:
+                return
+
+    def _stop_persist(self):
+        """Flush queued orders before the interpreter exits"""
+        self._persist_q.put(None)
+        self._persist_thread.join(timeout=5)
+
+    def _write_orders(self, orders: List[Dict]):
+        try:
+            save_orders_many(orders)
+        except Exception:
+            self.logger.warning(f"Failed to persist {len(orders)} order(s) to DB")
+
     def setup_logging(self):
         """Setup comprehensive logging system"""
         # Create logger
@@ -93,9 +208,14 @@ class TradingBot:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Handlers run on a listener thread; the caller only enqueues the record
+        log_q: queue.Queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_q))
+        self._log_listener = logging.handlers.QueueListener(
+            log_q, file_handler, console_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
     
     def test_connection(self):
         """Test API connection and log response"""
@@ -104,7 +224,8 @@ class TradingBot:
             self.client.ping()
             account_info = self.client.get_account()
             self.logger.info("API connection successful")
-            self.logger.debug(f"Account info: {json.dumps(account_info, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Account info: %s", _dumps(account_info))
             return True
         except Exception as e:
             self.logger.error(f"API connection failed: {e}")
@@ -112,33 +233,75 @@ class TradingBot:
     
     def get_symbol_info(self, symbol: str) -> Optional[Dict]:
         """Get symbol information for validation"""
+        return self._lookup_symbol(symbol.upper())
+
+    def _lookup_symbol(self, sym_u: str) -> Optional[Dict]:
+        """get_symbol_info for an already upper-cased symbol"""
         try:
-            exchange_info = self.client.get_exchange_info()
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol.upper():
-                    return s
-            return None
+            if time.monotonic() - self._exchange_info_ts >= SYMBOL_INFO_TTL:
+                self._refresh_exchange_info()
+            return self._symbols_by_name.get(sym_u)
         except Exception as e:
-            self.logger.error(f"Failed to get symbol info for {symbol}: {e}")
+            self.logger.error(f"Failed to get symbol info for {sym_u}: {e}")
             return None
+
+    def _refresh_exchange_info(self):
+        """Fetch exchange_info once and index every symbol and its parsed filters"""
+        exchange_info = self.client.get_exchange_info()
+        symbols_by_name = {s['symbol']: s for s in exchange_info['symbols']}
+        filter_cache = {}
+        for name, s in symbols_by_name.items():
+            by_type = {f.get('filterType'): f for f in s.get('filters', [])}
+            filters = {}
+            if 'LOT_SIZE' in by_type:
+                filters['lot'] = _step_grid(by_type['LOT_SIZE']['stepSize'])
+            if 'PRICE_FILTER' in by_type:
+                filters['price'] = _step_grid(by_type['PRICE_FILTER']['tickSize'])
+            filter_cache[name] = filters
+        self._symbols_by_name = symbols_by_name
+        self._filter_cache = filter_cache
+        self._exchange_info_ts = time.monotonic()
+
+    def _symbol_filters(self, sym_u: str) -> Dict[str, Dict[str, Any]]:
+        self._lookup_symbol(sym_u)  # refreshes the caches when stale
+        return self._filter_cache.get(sym_u, {})
+
+    def _order_fn(self, symbol: str) -> Callable[..., Dict]:
+        """create_order bound to an upper-cased symbol, built on first use"""
+        fn = self._create_order.get(symbol)
+        if fn is None:
+            fn = self._create_order[symbol] = functools.partial(self.client.create_order, symbol=symbol)
+        return fn
+
+    def _invalidate_symbol(self, symbol: str, error: BinanceAPIException):
+        """Drop cached info when Binance reports the symbol as invalid (-1121)"""
+        if error.code == -1121:
+            sym_u = symbol.upper()
+            self._symbols_by_name.pop(sym_u, None)
+            self._filter_cache.pop(sym_u, None)
+            # the cached listing disagrees with the exchange; refetch on next lookup
+            self._exchange_info_ts = float('-inf')
     
     def validate_order_params(self, symbol: str, side: str, order_type: str, 
                             quantity: float, price: float = None) -> bool:
         """Validate order parameters"""
+        sym_u = symbol.upper()
+        side_u = side.upper()
+        type_u = order_type.upper()
+
         # Get symbol info
-        symbol_info = self.get_symbol_info(symbol)
+        symbol_info = self._lookup_symbol(sym_u)
         if not symbol_info:
             self.logger.error(f"Invalid symbol: {symbol}")
             return False
         
         # Validate side
-        if side.upper() not in ['BUY', 'SELL']:
+        if side_u not in _VALID_SIDES:
             self.logger.error(f"Invalid side: {side}")
             return False
         
         # Validate order type (Spot)
-        valid_types = ['MARKET', 'LIMIT', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT']
-        if order_type.upper() not in valid_types:
+        if type_u not in _VALID_TYPES:
             self.logger.error(f"Invalid order type: {order_type}")
             return False
         
@@ -148,7 +311,7 @@ class TradingBot:
             return False
         
         # Validate price for limit orders
-        if order_type.upper() in ['LIMIT', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'] and (price is None or price <= 0):
+        if type_u in _PRICED_TYPES and (price is None or price <= 0):
             self.logger.error(f"Price required for {order_type} orders")
             return False
         
@@ -156,26 +319,17 @@ class TradingBot:
     
     def format_quantity(self, symbol: str, quantity: float) -> str:
         """Format quantity according to LOT_SIZE step size"""
-        symbol_info = self.get_symbol_info(symbol)
-        if symbol_info:
-            for f in symbol_info['filters']:
-                if f.get('filterType') == 'LOT_SIZE':
-                    step = Decimal(str(f['stepSize']))
-                    # Quantize down to the nearest step
-                    q = (Decimal(str(quantity)) // step) * step
-                    # Normalize to string without scientific notation
-                    return format(q.normalize(), 'f')
+        lot = self._symbol_filters(symbol.upper()).get('lot')
+        if lot:
+            # Quantize down to the nearest step
+            return _quantize_down(quantity, lot)
         return str(quantity)
 
     def format_price(self, symbol: str, price: float) -> str:
         """Format price according to PRICE_FILTER tick size"""
-        symbol_info = self.get_symbol_info(symbol)
-        if symbol_info:
-            for f in symbol_info['filters']:
-                if f.get('filterType') == 'PRICE_FILTER':
-                    tick = Decimal(str(f['tickSize']))
-                    p = (Decimal(str(price)) // tick) * tick
-                    return format(p.normalize(), 'f')
+        tick = self._symbol_filters(symbol.upper()).get('price')
+        if tick:
+            return _quantize_down(price, tick)
         return str(price)
     
     def place_market_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
@@ -191,31 +345,30 @@ class TradingBot:
             Dict: Order response
         """
         try:
+            sym_u = symbol.upper()
+
             # Validate parameters
-            if not self.validate_order_params(symbol, side, 'MARKET', quantity):
+            if not self.validate_order_params(sym_u, side, 'MARKET', quantity):
                 raise ValueError("Invalid order parameters")
             
             # Format quantity
-            formatted_quantity = self.format_quantity(symbol, quantity)
+            formatted_quantity = self.format_quantity(sym_u, quantity)
             
             # Log the order request
             self.logger.info(f"Placing MARKET order: {side} {formatted_quantity} {symbol}")
             
             # Place the order
-            order = self.client.create_order(
-                symbol=symbol.upper(),
+            order = self._order_fn(sym_u)(
                 side=side.upper(),
                 type='MARKET',
                 quantity=formatted_quantity
             )
             
-            # Persist and log
-            try:
-                save_order(order)
-            except Exception:
-                self.logger.warning("Failed to persist order to DB")
+            # Persist (in the background) and log
+            self._persist_q.put_nowait(order)
             self.logger.info(f"Market order placed successfully: {order['orderId']}")
-            self.logger.debug(f"Order details: {json.dumps(order, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Order details: %s", _dumps(order))
             
             return {
                 'success': True,
@@ -229,6 +382,7 @@ class TradingBot:
             }
             
         except BinanceAPIException as e:
+            self._invalidate_symbol(symbol, e)
             self.logger.error(f"Binance API error: {e}")
             return {'success': False, 'error': str(e)}
         except Exception as e:
@@ -249,20 +403,21 @@ class TradingBot:
             Dict: Order response
         """
         try:
+            sym_u = symbol.upper()
+
             # Validate parameters
-            if not self.validate_order_params(symbol, side, 'LIMIT', quantity, price):
+            if not self.validate_order_params(sym_u, side, 'LIMIT', quantity, price):
                 raise ValueError("Invalid order parameters")
             
             # Format quantity and price
-            formatted_quantity = self.format_quantity(symbol, quantity)
-            formatted_price = self.format_price(symbol, price)
+            formatted_quantity = self.format_quantity(sym_u, quantity)
+            formatted_price = self.format_price(sym_u, price)
             
             # Log the order request
             self.logger.info(f"Placing LIMIT order: {side} {formatted_quantity} {symbol} at ${formatted_price}")
             
             # Place the order
-            order = self.client.create_order(
-                symbol=symbol.upper(),
+            order = self._order_fn(sym_u)(
                 side=side.upper(),
                 type='LIMIT',
                 timeInForce='GTC',
@@ -270,13 +425,11 @@ class TradingBot:
                 price=str(formatted_price)
             )
             
-            # Persist and log
-            try:
-                save_order(order)
-            except Exception:
-                self.logger.warning("Failed to persist order to DB")
+            # Persist (in the background) and log
+            self._persist_q.put_nowait(order)
             self.logger.info(f"Limit order placed successfully: {order['orderId']}")
-            self.logger.debug(f"Order details: {json.dumps(order, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Order details: %s", _dumps(order))
             
             return {
                 'success': True,
@@ -291,6 +444,7 @@ class TradingBot:
             }
             
         except BinanceAPIException as e:
+            self._invalidate_symbol(symbol, e)
             self.logger.error(f"Binance API error: {e}")
             return {'success': False, 'error': str(e)}
         except Exception as e:
@@ -313,25 +467,26 @@ class TradingBot:
             Dict: Order response
         """
         try:
+            sym_u = symbol.upper()
+
             # Validate parameters
-            if not self.validate_order_params(symbol, side, 'STOP_LOSS_LIMIT', quantity, price):
+            if not self.validate_order_params(sym_u, side, 'STOP_LOSS_LIMIT', quantity, price):
                 raise ValueError("Invalid order parameters")
             
             if stop_price <= 0:
                 raise ValueError("Invalid stop price")
             
             # Format quantity
-            formatted_quantity = self.format_quantity(symbol, quantity)
-            formatted_price = self.format_price(symbol, price)
-            formatted_stop = self.format_price(symbol, stop_price)
+            formatted_quantity = self.format_quantity(sym_u, quantity)
+            formatted_price = self.format_price(sym_u, price)
+            formatted_stop = self.format_price(sym_u, stop_price)
             
             # Log the order request
             self.logger.info(f"Placing STOP_LIMIT order: {side} {formatted_quantity} {symbol} "
                            f"at ${formatted_price}, stop: ${formatted_stop}")
             
             # Place the order
-            order = self.client.create_order(
-                symbol=symbol.upper(),
+            order = self._order_fn(sym_u)(
                 side=side.upper(),
                 type='STOP_LOSS_LIMIT',
                 timeInForce='GTC',
@@ -340,13 +495,11 @@ class TradingBot:
                 stopPrice=str(formatted_stop)
             )
             
-            # Persist and log
-            try:
-                save_order(order)
-            except Exception:
-                self.logger.warning("Failed to persist order to DB")
+            # Persist (in the background) and log
+            self._persist_q.put_nowait(order)
             self.logger.info(f"Stop-limit order placed successfully: {order['orderId']}")
-            self.logger.debug(f"Order details: {json.dumps(order, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Order details: %s", _dumps(order))
             
             return {
                 'success': True,
@@ -362,6 +515,7 @@ class TradingBot:
             }
             
         except BinanceAPIException as e:
+            self._invalidate_symbol(symbol, e)
             self.logger.error(f"Binance API error: {e}")
             return {'success': False, 'error': str(e)}
         except Exception as e:
@@ -409,12 +563,76 @@ class TradingBot:
             return {'success': False, 'error': str(e)}
 
 
+def _script_handlers(bot: TradingBot, oco: OCOManager, twap: TWAPExecutor, grid: GridTrader,
+                     strategy: SMACrossover) -> Dict[str, Callable[[Dict], Dict]]:
+    """op -> handler for --script commands; each takes the command dict in place of prompts"""
+    def backtest(c):
+        bars = DataFetcher(bot.client).klines(c.get('symbol', 'BTCUSDT').upper(),
+                                              interval=c.get('interval', Client.KLINE_INTERVAL_1MINUTE),
+                                              limit=int(c.get('limit', 500)))
+        if c.get('sweep'):
+            results = Backtester.sweep(bars.c, range(5, 51, 5), range(20, 201, 10))
+            return {'success': True, 'results': results[:int(c.get('top', 5))]}
+        res = Backtester(strategy).run_vectorized(c.get('symbol', 'BTCUSDT'), bars.c)
+        return {'success': True, 'equity': res['equity'], 'trades': len(res['trades'])}
+
+    return {
+        'market': lambda c: bot.place_market_order(c['symbol'].upper(), c['side'].upper(), float(c['quantity'])),
+        'limit': lambda c: bot.place_limit_order(c['symbol'].upper(), c['side'].upper(), float(c['quantity']),
+                                                 float(c['price'])),
+        'stop_limit': lambda c: bot.place_stop_limit_order(c['symbol'].upper(), c['side'].upper(),
+                                                           float(c['quantity']), float(c['price']),
+                                                           float(c['stop_price'])),
+        'status': lambda c: bot.get_order_status(c['symbol'].upper(), int(c['order_id'])),
+        'cancel': lambda c: bot.cancel_order(c['symbol'].upper(), int(c['order_id'])),
+        'balance': lambda c: bot.get_account_balance(),
+        'oco': lambda c: oco.submit(c['symbol'].upper(), c['side'].upper(), str(c['quantity']),
+                                    str(c['take_profit']), str(c['stop_loss'])),
+        'twap': lambda c: twap.execute(c['symbol'].upper(), c['side'].upper(), float(c['total_qty']),
+                                       int(c['duration']), int(c['slices'])),
+        'grid': lambda c: grid.build_grid(c['symbol'].upper(), float(c['base_price']), int(c['levels']),
+                                          float(c['step_pct']), str(c['quantity']), c['side'].upper()),
+        'backtest': backtest,
+    }
+
+
+def run_script(path: str, handlers: Dict[str, Callable[[Dict], Dict]]):
+    """
+    Run newline-delimited JSON commands from path, e.g. {"op": "market", "symbol": "BTCUSDT", ...}
+
+    Each result is written to stdout as one JSON line tagged with its line number and op.
+    """
+    out = sys.stdout.buffer
+    with open(path, 'rb') as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            op = None
+            try:
+                cmd = orjson.loads(line)
+                op = cmd.get('op')
+                handler = handlers.get(op)
+                if handler is None:
+                    result = {'success': False, 'error': f"Unknown op: {op}"}
+                else:
+                    result = handler(cmd)
+            except KeyError as e:
+                result = {'success': False, 'error': f"Missing field: {e.args[0]}"}
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            out.write(orjson.dumps({'line': lineno, 'op': op, **result}, default=str,
+                                   option=orjson.OPT_APPEND_NEWLINE))
+            out.flush()
+
+
 def main():
     """Main function with CLI interface"""
     parser = argparse.ArgumentParser(description='Binance Spot Trading Bot')
     parser.add_argument('--api-key', help='Binance API Key (or set BINANCE_API_KEY)')
     parser.add_argument('--api-secret', help='Binance API Secret (or set BINANCE_API_SECRET)')
     parser.add_argument('--testnet', action='store_true', default=True, help='Use testnet (default)')
+    parser.add_argument('--sweep', action='store_true', help='Backtest: sweep SMA fast/slow windows instead of one run')
+    parser.add_argument('--script', metavar='PATH', help='Run JSON-lines commands from PATH instead of the menu')
     
     args = parser.parse_args()
     
@@ -446,11 +664,17 @@ def main():
         api_thread = None
         api_services = None
 
-        print("🚀 Trading Bot initialized successfully!")
-        print("=" * 50)
+        if not args.script:
+            print("🚀 Trading Bot initialized successfully!")
+            print("=" * 50)
     except Exception as e:
         print(f"❌ Failed to initialize bot: {e}")
         return
+
+    # Scripted mode: stdout carries only JSON-line results
+    if args.script:
+        run_script(args.script, _script_handlers(bot, oco, twap, grid, strategy))
+        return
     
     # Interactive CLI
     while True:
@@ -633,9 +857,15 @@ def main():
                 limit = 500
                 fetcher = DataFetcher(bot.client)
                 bars = fetcher.klines(symbol, interval=interval, limit=limit)
-                bt = Backtester(strategy)
-                res = bt.run(symbol, bars)
-                print(f"✅ Backtest finished. Trades: {len(res['trades'])}")
+                if args.sweep:
+                    results = Backtester.sweep(bars.c, range(5, 51, 5), range(20, 201, 10))
+                    print(f"✅ Sweep finished over {len(results)} window pairs. Best:")
+                    for r in results[:5]:
+                        print(f"  fast={r['fast']} slow={r['slow']} equity={r['equity']:.2f} trades={r['trades']}")
+                else:
+                    bt = Backtester(strategy)
+                    res = bt.run_vectorized(symbol, bars.c)
+                    print(f"✅ Backtest finished. Trades: {len(res['trades'])}")
 
             else:
                 print("❌ Invalid choice. Please select 1-14.")